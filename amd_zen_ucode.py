@@ -10,49 +10,120 @@
 #####################################################################################################
 #####################################################################################################
 
+import collections
+import functools
 import json
 import os
+import sys
+import types
+from concurrent.futures import ThreadPoolExecutor
+from typing import Final
 
 from binaryninja import (
     PluginCommand, log_info, log_warn, log_error,
     Type, StructureBuilder, EnumerationBuilder, QualifiedName,
-    Symbol, SymbolType
+    Symbol, SymbolType, get_int_input
 )
 
+# NumPy ships with Binary Ninja's bundled Python; keep it optional anyway so
+# the plugin still loads on stripped-down environments.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Numba is optional: when present, the uop-opcode histogram runs as an LLVM-
+# compiled loop over the raw byte buffer; otherwise NumPy (or plain Python)
+# does the counting.
+try:
+    from numba import njit
+
+    @njit(cache=True)
+    def _uop_opcode_hist(u8buf):
+        # u8buf is the flat uint8 uop stream; the opcode is byte 0 of each
+        # 4-byte uop. Flat scalar indexing on purpose: structured dtypes are
+        # much slower under Numba.
+        hist = np.zeros(256, np.int64)
+        for i in range(0, u8buf.shape[0] - 3, 4):
+            hist[u8buf[i]] += 1
+        return hist
+except ImportError:
+    if np is not None:
+        def _uop_opcode_hist(u8buf):
+            return np.bincount(u8buf[::4], minlength=256)
+    else:
+        def _uop_opcode_hist(u8buf):
+            hist = [0] * 256
+            for i in range(0, len(u8buf) - 3, 4):
+                hist[u8buf[i]] += 1
+            return hist
+
+#############################
+# Deferred logging: skip the formatting work when BN is going to drop the
+# message anyway. Matters in sweep mode, where applies log per slot.
+#############################
+_INFO_LEVEL = 1  # LogLevel.InfoLog
+_WARN_LEVEL = 2  # LogLevel.WarningLog
+
+def _min_log_level():
+    """Best-effort query of BN's minimum log level; None if unavailable."""
+    try:
+        import binaryninja
+        probe = getattr(getattr(binaryninja, "core", None), "BNGetMinimumLogLevel", None)
+        if probe is not None:
+            return int(probe())
+    except Exception:
+        pass
+    return None
+
+_LOG_LEVEL = _min_log_level()
+
+def _log_info_lazy(fmt, *args):
+    if _LOG_LEVEL is not None and _LOG_LEVEL > _INFO_LEVEL:
+        return
+    log_info(fmt.format(*args))
+
+def _log_warn_lazy(fmt, *args):
+    if _LOG_LEVEL is not None and _LOG_LEVEL > _WARN_LEVEL:
+        return
+    log_warn(fmt.format(*args))
+
 #############################
 # Layout constants
+# Final so downstream AOT compilers (mypyc/Cython consumers) may
+# constant-fold them.
 #############################
-PATCH_SIZE = 0x3820
+PATCH_SIZE: Final = 0x3820
 
-HDR_OFF         = 0x0000
-HDR_SIZE        = 0x0020
+HDR_OFF:        Final = 0x0000
+HDR_SIZE:       Final = 0x0020
 
-SIGNATURE_OFF   = 0x0020
-SIGNATURE_SIZE  = 0x0100
+SIGNATURE_OFF:  Final = 0x0020
+SIGNATURE_SIZE: Final = 0x0100
 
-MODULUS_OFF     = 0x0120
-MODULUS_SIZE    = 0x0100
+MODULUS_OFF:    Final = 0x0120
+MODULUS_SIZE:   Final = 0x0100
 
-CHECK_OFF       = 0x0220
-CHECK_SIZE      = 0x0100
+CHECK_OFF:      Final = 0x0220
+CHECK_SIZE:     Final = 0x0100
 
-OPTIONS_OFF     = 0x0320
-OPTIONS_SIZE    = 0x0004
+OPTIONS_OFF:    Final = 0x0320
+OPTIONS_SIZE:   Final = 0x0004
 
-REV_OFF         = 0x0324
-REV_SIZE        = 0x0004
+REV_OFF:        Final = 0x0324
+REV_SIZE:       Final = 0x0004
 
-MATCH_OFF       = 0x0328
-MATCH_SIZE      = 0x0028
+MATCH_OFF:      Final = 0x0328
+MATCH_SIZE:     Final = 0x0028
 
-MASK_OFF        = 0x0350
-MASK_SIZE       = 0x0030
+MASK_OFF:       Final = 0x0350
+MASK_SIZE:      Final = 0x0030
 
-MICROCODE_OFF   = 0x0380
-MICROCODE_SIZE  = PATCH_SIZE - MICROCODE_OFF
+MICROCODE_OFF:  Final = 0x0380
+MICROCODE_SIZE: Final = PATCH_SIZE - MICROCODE_OFF
 
-UOP_SIZE        = 4
-UOP_COUNT       = MICROCODE_SIZE // UOP_SIZE
+UOP_SIZE:       Final = 4
+UOP_COUNT:      Final = MICROCODE_SIZE // UOP_SIZE
 
 #############################
 # Names to define
@@ -67,9 +138,25 @@ T_MATCH         = "AMD_MC_MatchRegisterBlock"
 T_MASK          = "AMD_MC_MaskRegisterBlock"
 
 T_UOP           = "AMD_Zen_MicroOp"
+T_UOP32         = "AMD_Zen_MicroOp_u32"
 T_MICROCODE     = "AMD_Zen_MicrocodeRegion"
 T_PATCH         = "AMD_MC_Patch"
 
+#############################
+# Sub-regions inside AMD_MC_Patch: (offset, symbol, comment).
+# Offset 0 (the header) is covered by the container symbol itself.
+#############################
+PATCH_SUB_SYMBOLS = [
+    (SIGNATURE_OFF, "amd_mc_signature",  "0x100-byte signature block"),
+    (MODULUS_OFF,   "amd_mc_modulus",    "0x100-byte modulus block"),
+    (CHECK_OFF,     "amd_mc_check",      "0x100-byte check block"),
+    (OPTIONS_OFF,   "amd_mc_options",    "autorun/encrypted/loaderid option bytes"),
+    (REV_OFF,       "amd_mc_rev",        "Revision copy from the extended header area"),
+    (MATCH_OFF,     "amd_mc_match_regs", "Match register block"),
+    (MASK_OFF,      "amd_mc_mask_regs",  "Mask register block"),
+    (MICROCODE_OFF, "amd_ucode_region",  "Decoded microcode uop region"),
+]
+
 #############################
 # Enum values
 #############################
@@ -84,47 +171,68 @@ LOADER_ID_ENUM = {
 # Important: the byte alone is not a full micro-op decode. Several meanings are
 # opclass-dependent, e.g. 0x00 is OP_LD/OP_ST, 0xA0 is OP_MOV/OP_SREG, and
 # 0xFF is OP_NOP only for OPCLASS_SPEC.
-ZEN_OPCODE_ENUM = {
+# Names are interned so the member strings are shared with any BN-side
+# lookups instead of duplicated per process.
+ZEN_OPCODE_ITEMS = tuple((sys.intern(k), v) for k, v in (
     # Class-dependent / non-RegOp opcodes
-    "AMD_ZEN_UOP_LD_ST_00":        0x00,
-    "AMD_ZEN_BR_JMP":              0x05,
+    ("AMD_ZEN_UOP_LD_ST_00",        0x00),
+    ("AMD_ZEN_BR_JMP",              0x05),
 
     # RegOp / RegX opcodes
-    "AMD_ZEN_REG_NSUB":             0x19,
-    "AMD_ZEN_REG_AND":              0x30,
-    "AMD_ZEN_REG_SHL":              0x40,
-    "AMD_ZEN_REG_BLL":              0x41,
-    "AMD_ZEN_REG_ROL":              0x42,
-    "AMD_ZEN_REG_RLC":              0x44,
-    "AMD_ZEN_REG_RRD":              0x46,
-    "AMD_ZEN_REG_SRC":              0x47,
-    "AMD_ZEN_REG_SHR":              0x48,
-    "AMD_ZEN_REG_ROR":              0x4A,
-    "AMD_ZEN_REG_RRC":              0x4C,
-    "AMD_ZEN_REG_SRD":              0x4F,
-    "AMD_ZEN_REG_SUB":              0x50,
-    "AMD_ZEN_REG_SBB":              0x52,
-    "AMD_ZEN_REG_NADD":             0x55,
-    "AMD_ZEN_REG_ADD2":             0x5C,
-    "AMD_ZEN_REG_ADC":              0x5D,
-    "AMD_ZEN_REG_ADD3":             0x5E,
-    "AMD_ZEN_REG_ADD":              0x5F,
-    "AMD_ZEN_REG_VZEROUPPER_64B":   0x6F,
-    "AMD_ZEN_REG_POPCNT":           0x70,
-    "AMD_ZEN_REG_SBIT":             0x72,
-    "AMD_ZEN_REG_VZEROUPPER_32B":   0x7F,
-    "AMD_ZEN_REG_MOV2":             0x93,
-    "AMD_ZEN_REG_MOV_SREG":         0xA0,
-    "AMD_ZEN_REG_BSWAP":            0xA9,
-    "AMD_ZEN_REG_XOR":              0xB5,
-    "AMD_ZEN_REG_OR":               0xBE,
-    "AMD_ZEN_REG_SRC_CF_CANDIDATE": 0x47, # Research-ToDo: CF-candidate / target-like imm -> not confirmed as branch opcode yet
+    ("AMD_ZEN_REG_NSUB",             0x19),
+    ("AMD_ZEN_REG_AND",              0x30),
+    ("AMD_ZEN_REG_SHL",              0x40),
+    ("AMD_ZEN_REG_BLL",              0x41),
+    ("AMD_ZEN_REG_ROL",              0x42),
+    ("AMD_ZEN_REG_RLC",              0x44),
+    ("AMD_ZEN_REG_RRD",              0x46),
+    ("AMD_ZEN_REG_SRC",              0x47),
+    ("AMD_ZEN_REG_SHR",              0x48),
+    ("AMD_ZEN_REG_ROR",              0x4A),
+    ("AMD_ZEN_REG_RRC",              0x4C),
+    ("AMD_ZEN_REG_SRD",              0x4F),
+    ("AMD_ZEN_REG_SUB",              0x50),
+    ("AMD_ZEN_REG_SBB",              0x52),
+    ("AMD_ZEN_REG_NADD",             0x55),
+    ("AMD_ZEN_REG_ADD2",             0x5C),
+    ("AMD_ZEN_REG_ADC",              0x5D),
+    ("AMD_ZEN_REG_ADD3",             0x5E),
+    ("AMD_ZEN_REG_ADD",              0x5F),
+    ("AMD_ZEN_REG_VZEROUPPER_64B",   0x6F),
+    ("AMD_ZEN_REG_POPCNT",           0x70),
+    ("AMD_ZEN_REG_SBIT",             0x72),
+    ("AMD_ZEN_REG_VZEROUPPER_32B",   0x7F),
+    ("AMD_ZEN_REG_MOV2",             0x93),
+    ("AMD_ZEN_REG_MOV_SREG",         0xA0),
+    ("AMD_ZEN_REG_BSWAP",            0xA9),
+    ("AMD_ZEN_REG_XOR",              0xB5),
+    ("AMD_ZEN_REG_OR",               0xBE),
+    ("AMD_ZEN_REG_SRC_CF_CANDIDATE", 0x47), # Research-ToDo: CF-candidate / target-like imm -> not confirmed as branch opcode yet
 
     # SpecOp opcode
-    "AMD_ZEN_SPEC_NOP":             0xFF,
+    ("AMD_ZEN_SPEC_NOP",             0xFF),
 
-    "AMD_ZEN_TYPE5_READ":           0xDE,
-}
+    ("AMD_ZEN_TYPE5_READ",           0xDE),
+))
+
+# Read-only mapping alias for external users; the ordered tuple above is what
+# the enum builder consumes. The proxy keeps accidental mutation from
+# desyncing anything cached off these values.
+ZEN_OPCODE_ENUM = types.MappingProxyType(dict(ZEN_OPCODE_ITEMS))
+
+# Reverse lookup for reporting: opcode byte -> known enum names (several
+# opcodes carry more than one name, e.g. the 0x47 research candidate).
+_OPCODE_NAMES = {}
+for _name, _val in ZEN_OPCODE_ITEMS:
+    _OPCODE_NAMES.setdefault(_val, []).append(_name)
+
+# The region is stored as dense uint32 words; fields are extracted on demand
+# instead of materializing thousands of 4-byte structs in the type system.
+Uop = collections.namedtuple("Uop", "opcode b1 imm16")
+
+def decode_uop(word: int) -> Uop:
+    """Split a little-endian 32-bit uop word into its (opcode, b1, imm16) fields."""
+    return Uop(word & 0xFF, (word >> 8) & 0xFF, word >> 16)
 
 #############################
 # CPUID -> CPU description lookup
@@ -190,63 +298,168 @@ def _cpuid_description(cpuid_val):
 #############################
 # Helpers for old Type.int() signatures
 #############################
+@functools.lru_cache(maxsize=None)
 def _qn(s: str) -> QualifiedName:
     return QualifiedName(s)
 
-def _uint(width: int):
+# QualifiedName objects for the fixed type names, built once at import so
+# repeated type operations reuse the same immutable instances.
+QN_LOADER_ENUM = _qn(T_LOADER_ENUM)
+QN_OPCODE_ENUM = _qn(T_OPCODE_ENUM)
+QN_CPUID       = _qn(T_CPUID)
+QN_HDR         = _qn(T_HDR)
+QN_OPTS        = _qn(T_OPTS)
+QN_MATCH       = _qn(T_MATCH)
+QN_MASK        = _qn(T_MASK)
+QN_UOP         = _qn(T_UOP)
+QN_UOP32       = _qn(T_UOP32)
+QN_MICROCODE   = _qn(T_MICROCODE)
+QN_PATCH       = _qn(T_PATCH)
+
+def _probe_int_factory():
     """
-    Create an unsigned integer type of size "width" bytes across BN API variants.
-    Tries several positional signatures.
+    Find the Type.int signature this BN build accepts, by trying each variant
+    against a harmless probe. Runs once at import.
     """
+    for make in (
+        lambda w: Type.int(w, False),
+        lambda w: Type.int(w, 0),
+        lambda w: Type.int(w),
+    ):
+        try:
+            make(1)
+            return make
+        except Exception:
+            continue
+    raise RuntimeError("Cannot construct Type.int on this BN build")
+
+def _probe_struct_factory():
+    probe = StructureBuilder.create()
+    if hasattr(Type, "structure"):
+        try:
+            Type.structure(probe)
+            return Type.structure
+        except Exception:
+            pass
+    if hasattr(Type, "structure_type"):
+        return Type.structure_type
+    raise RuntimeError("No Type.structure / Type.structure_type available on this BN build")
+
+def _probe_enum_builder_factory():
     try:
-        return Type.int(width, False)
-    except TypeError:
+        EnumerationBuilder.create()
+        return EnumerationBuilder.create
+    except Exception:
         pass
     try:
-        return Type.int(width, 0)
-    except TypeError:
-        pass
+        EnumerationBuilder()
+        return EnumerationBuilder
+    except Exception:
+        return None
+
+def _probe_enum_type_factory(builder_factory):
+    """
+    Find a callable(eb, width) -> enum Type for this BN build, or None if
+    enums cannot be created (callers fall back to plain uints).
+    """
+    if builder_factory is None:
+        return None
+    eb = builder_factory()
     try:
-        return Type.int(width)
-    except Exception as e:
-        raise RuntimeError(f"Cannot construct Type.int({width}): {e}")
+        # Give the probe builder one member so it looks like the real thing;
+        # some variants may reject an empty enum.
+        eb.append("_probe", 0)
+    except Exception:
+        pass
+    candidates = []
+    if hasattr(Type, "enumeration"):
+        candidates.append(lambda e, w: Type.enumeration(e))
+    if hasattr(Type, "enumeration_type"):
+        candidates.append(lambda e, w: Type.enumeration_type(w, e))
+        candidates.append(lambda e, w: Type.enumeration_type(e, w))
+        candidates.append(lambda e, w: Type.enumeration_type(e))
+    for fn in candidates:
+        try:
+            fn(eb, 1)
+            return fn
+        except Exception:
+            continue
+    return None
+
+# Capability detection: resolve the API variants once at import so the
+# helpers below are direct calls with no per-call probing.
+_INT_FACTORY = _probe_int_factory()
+_STRUCT_FACTORY = _probe_struct_factory()
+_ENUM_BUILDER_FACTORY = _probe_enum_builder_factory()
+_ENUM_TYPE_FACTORY = _probe_enum_type_factory(_ENUM_BUILDER_FACTORY)
+
+@functools.lru_cache(maxsize=None)
+def _uint(width: int):
+    return _INT_FACTORY(width)
+
+_U8  = _uint(1)
+_U16 = _uint(2)
+_U32 = _uint(4)
 
 def u8():
-    return _uint(1)
+    return _U8
 
 def u16():
-    return _uint(2)
+    return _U16
 
 def u32():
-    return _uint(4)
+    return _U32
 
 def _type_structure(sb):
-    if hasattr(Type, "structure"):
-        try:
-            return Type.structure(sb)
-        except Exception:
-            pass
-    if hasattr(Type, "structure_type"):
-        return Type.structure_type(sb)
-    raise RuntimeError("No Type.structure / Type.structure_type available on this BN build")
+    return _STRUCT_FACTORY(sb)
 
-def _make_enum_type_best_effort(values: dict, width: int = 1):
+def _build_struct(specs, packed: bool = True):
     """
-    Try to create an enum Type across BN API variants.
-    If it cannot be created, return None (caller will fall back to plain uint).
+    Build a structure type from a list of (type, name) field specs.
+    One builder, one append loop, one exception scope.
     """
-    eb = None
-    try:
-        eb = EnumerationBuilder.create()
-    except Exception:
-        try:
-            eb = EnumerationBuilder()
-        except Exception:
-            eb = None
+    sb = StructureBuilder.create()
+    sb.packed = packed
+    for t, n in specs:
+        sb.append(t, n)
+    return _type_structure(sb)
+
+#############################
+# Field specs for the fixed-layout structs (built once at import)
+#############################
+CPUID_SPEC = [
+    (_U32, "proc_sig"),
+]
+
+OPTS_SPEC = [
+    (_U8,  "autorun"),
+    (_U8,  "encrypted"),
+    (_U16, "loaderid"),
+]
+
+# Signature/modulus/check are all 0x100-byte blocks; share one array type
+# instead of constructing three identical ones.
+_U8_BLOCK = Type.array(_U8, SIGNATURE_SIZE)
 
-    if eb is None:
+MATCH_SPEC = [
+    (Type.array(_U32, 10), "match_reg"),
+]
+
+MASK_SPEC = [
+    (Type.array(_U32, 12), "mask_reg"),
+]
+
+def _make_enum_type_best_effort(values, width: int = 1):
+    """
+    Create an enum Type using the factories detected at import. Accepts a
+    mapping or an ordered iterable of (name, value) pairs.
+    If enums are unavailable, return None (caller falls back to plain uint).
+    """
+    if _ENUM_BUILDER_FACTORY is None or _ENUM_TYPE_FACTORY is None:
         return None
 
+    eb = _ENUM_BUILDER_FACTORY()
+
     try:
         eb.width = width
     except Exception:
@@ -258,39 +471,29 @@ def _make_enum_type_best_effort(values: dict, width: int = 1):
         except Exception:
             pass
 
-    for k, v in values.items():
-        try:
+    items = values.items() if hasattr(values, "items") else values
+    # One exception barrier for the whole member list: a failure part-way
+    # through aborts cleanly to the fallback instead of leaving a ragged enum.
+    try:
+        for k, v in items:
             eb.append(k, v)
-        except Exception:
-            return None
-
-    if hasattr(Type, "enumeration"):
-        try:
-            return Type.enumeration(eb)
-        except Exception:
-            pass
-
-    if hasattr(Type, "enumeration_type"):
-        try:
-            return Type.enumeration_type(width, eb)
-        except Exception:
-            pass
-        try:
-            return Type.enumeration_type(eb, width)
-        except Exception:
-            pass
-        try:
-            return Type.enumeration_type(eb)
-        except Exception:
-            pass
+    except Exception:
+        return None
 
-    return None
+    try:
+        return _ENUM_TYPE_FACTORY(eb, width)
+    except Exception:
+        return None
 
 #############################
 # BinaryView helpers
 #############################
 def _safe_undef_var(bv, addr: int):
     try:
+        # Check first: most addresses have no prior definition, and the
+        # lookup is cheaper than an exception-driven undefine.
+        if bv.get_data_var_at(addr) is None:
+            return
         bv.undefine_user_data_var(addr)
     except Exception:
         pass
@@ -305,15 +508,30 @@ def _define_var(bv, addr: int, t, sym=None, comment=None):
 
 def _check_size(bv, base: int):
     try:
-        got = len(bv.read(base, PATCH_SIZE))
-        if got < PATCH_SIZE:
-            log_warn(
-                f"Only {got} bytes available from 0x{base:x}, expected 0x{PATCH_SIZE:x}. "
-                "Layout may be partial."
+        # Arithmetic on bv.end instead of bv.read: no point copying up to
+        # 0x3820 bytes just to measure how many are there.
+        avail = max(0, bv.end - base)
+        if avail < PATCH_SIZE:
+            _log_warn_lazy(
+                "Only {} bytes available from 0x{:x}, expected 0x{:x}. "
+                "Layout may be partial.",
+                avail, base, PATCH_SIZE
             )
     except Exception:
         pass
 
+def _snapshot(bv, base: int, size: int = HDR_SIZE):
+    """
+    One read of `size` bytes at `base`, wrapped for zero-copy slicing by
+    field validators (ndarray when NumPy is present, memoryview otherwise).
+    Header-sized by default - the only validator today reads header fields;
+    sweep mode shares its bulk read instead of calling this per slot.
+    """
+    data = bv.read(base, size)
+    if np is not None:
+        return np.frombuffer(data, dtype=np.uint8)
+    return memoryview(data)
+
 def _named_or_plain(bv, type_name: str, fallback):
     try:
         t = bv.get_type_by_name(type_name)
@@ -327,154 +545,238 @@ def _named_or_plain(bv, type_name: str, fallback):
 # Define ALL types
 #############################
 def _ensure_types(bv):
+    """
+    Define all plugin types in the database (once) and return them as a dict
+    keyed by type name. The dict is cached on the BinaryView so repeated
+    applies skip the per-type registry lookups.
+    """
+    # Plain attribute read first: an order of magnitude cheaper than a type-
+    # registry query, which matters when sweep mode re-enters per slot.
+    if getattr(bv, "_amd_mc_types_done", False):
+        return bv._amd_mc_types
     if bv.get_type_by_name(T_PATCH) is not None:
-        return
+        # Types already exist (defined manually or by an earlier session);
+        # look them up once and cache for subsequent applies. Only cache a
+        # complete set, so a partially-deleted database can still be repaired.
+        cached = {
+            name: bv.get_type_by_name(name)
+            for name in (T_HDR, T_OPTS, T_MATCH, T_MASK, T_MICROCODE, T_PATCH)
+        }
+        uop_t = bv.get_type_by_name(T_UOP)
+        if uop_t is not None:
+            cached["uop_named"] = Type.named_type_from_type(QN_UOP, uop_t)
+        uop32_t = bv.get_type_by_name(T_UOP32)
+        if uop32_t is not None:
+            cached["uop32_named"] = Type.named_type_from_type(QN_UOP32, uop32_t)
+        if all(cached.values()):
+            bv._amd_mc_types = cached
+            bv._amd_mc_types_done = True
+        return cached
 
     # LoaderId enum (u16) best effort
     loader_enum_t = _make_enum_type_best_effort(LOADER_ID_ENUM, width=2)
     if loader_enum_t is not None:
-        bv.define_user_type(_qn(T_LOADER_ENUM), loader_enum_t)
-        loader_field_t = Type.named_type_from_type(_qn(T_LOADER_ENUM), loader_enum_t)
+        bv.define_user_type(QN_LOADER_ENUM, loader_enum_t)
+        loader_field_t = Type.named_type_from_type(QN_LOADER_ENUM, loader_enum_t)
         log_info("AMD_MC_LoaderIdTag enum created (u16).")
     else:
         loader_field_t = u16()
         log_warn("Could not create AMD_MC_LoaderIdTag enum; loader_id will be uint16.")
 
     # Zen opcode enum (u8) best effort
-    opcode_enum_t = _make_enum_type_best_effort(ZEN_OPCODE_ENUM, width=1)
+    opcode_enum_t = _make_enum_type_best_effort(ZEN_OPCODE_ITEMS, width=1)
     if opcode_enum_t is not None:
-        bv.define_user_type(_qn(T_OPCODE_ENUM), opcode_enum_t)
-        opcode_field_t = Type.named_type_from_type(_qn(T_OPCODE_ENUM), opcode_enum_t)
+        bv.define_user_type(QN_OPCODE_ENUM, opcode_enum_t)
+        opcode_field_t = Type.named_type_from_type(QN_OPCODE_ENUM, opcode_enum_t)
         log_info("AMD_Zen_Opcode enum created (u8).")
     else:
         opcode_field_t = u8()
         log_warn("Could not create AMD_Zen_Opcode enum; opcode will be uint8.")
 
     # CpuId { u32 proc_sig; }
-    sb_cpuid = StructureBuilder.create()
-    sb_cpuid.packed = True
-    sb_cpuid.append(u32(), "proc_sig")
-    cpuid_t = _type_structure(sb_cpuid)
-    bv.define_user_type(_qn(T_CPUID), cpuid_t)
-    cpuid_named = Type.named_type_from_type(_qn(T_CPUID), cpuid_t)
+    cpuid_t = _build_struct(CPUID_SPEC)
+    bv.define_user_type(QN_CPUID, cpuid_t)
+    cpuid_named = Type.named_type_from_type(QN_CPUID, cpuid_t)
 
     # Header (0x20)
-    sb_hdr = StructureBuilder.create()
-    sb_hdr.packed = True
-    sb_hdr.append(u16(),           "year")              # 0x000
-    sb_hdr.append(u8(),            "day")               # 0x002
-    sb_hdr.append(u8(),            "month")             # 0x003
-    sb_hdr.append(u32(),           "update_revision")   # 0x004
-    sb_hdr.append(loader_field_t,  "loader_id")         # 0x008
-    sb_hdr.append(u8(),            "data_size")         # 0x00A
-    sb_hdr.append(u8(),            "init_flag")         # 0x00B
-    sb_hdr.append(u32(),           "data_checksum")     # 0x00C
-    sb_hdr.append(u16(),           "nb_ven")            # 0x010
-    sb_hdr.append(u16(),           "nb_dev")            # 0x012
-    sb_hdr.append(u16(),           "sb_ven")            # 0x014
-    sb_hdr.append(u16(),           "sb_dev")            # 0x016
-    sb_hdr.append(cpuid_named,     "proc_sig")          # 0x018
-    sb_hdr.append(u8(),            "bios_revision")     # 0x01C
-    sb_hdr.append(u8(),            "flags")             # 0x01D
-    sb_hdr.append(u8(),            "reserved")          # 0x01E
-    sb_hdr.append(u8(),            "reserved2")         # 0x01F
-    hdr_t = _type_structure(sb_hdr)
-    bv.define_user_type(_qn(T_HDR), hdr_t)
-    hdr_named = Type.named_type_from_type(_qn(T_HDR), hdr_t)
+    hdr_t = _build_struct([
+        (_U16,           "year"),              # 0x000
+        (_U8,            "day"),               # 0x002
+        (_U8,            "month"),             # 0x003
+        (_U32,           "update_revision"),   # 0x004
+        (loader_field_t, "loader_id"),         # 0x008
+        (_U8,            "data_size"),         # 0x00A
+        (_U8,            "init_flag"),         # 0x00B
+        (_U32,           "data_checksum"),     # 0x00C
+        (_U16,           "nb_ven"),            # 0x010
+        (_U16,           "nb_dev"),            # 0x012
+        (_U16,           "sb_ven"),            # 0x014
+        (_U16,           "sb_dev"),            # 0x016
+        (cpuid_named,    "proc_sig"),          # 0x018
+        (_U8,            "bios_revision"),     # 0x01C
+        (_U8,            "flags"),             # 0x01D
+        (_U8,            "reserved"),          # 0x01E
+        (_U8,            "reserved2"),         # 0x01F
+    ])
+    bv.define_user_type(QN_HDR, hdr_t)
+    hdr_named = Type.named_type_from_type(QN_HDR, hdr_t)
 
     # UcodeOptions { u8 autorun; u8 encrypted; u16 loaderid; }
-    sb_opts = StructureBuilder.create()
-    sb_opts.packed = True
-    sb_opts.append(u8(), "autorun")
-    sb_opts.append(u8(), "encrypted")
-    sb_opts.append(u16(), "loaderid")
-    opts_t = _type_structure(sb_opts)
-    bv.define_user_type(_qn(T_OPTS), opts_t)
-    opts_named = Type.named_type_from_type(_qn(T_OPTS), opts_t)
+    opts_t = _build_struct(OPTS_SPEC)
+    bv.define_user_type(QN_OPTS, opts_t)
+    opts_named = Type.named_type_from_type(QN_OPTS, opts_t)
 
     # MatchRegisterBlock { u32 match_reg[10]; }
-    sb_match = StructureBuilder.create()
-    sb_match.packed = True
-    sb_match.append(Type.array(u32(), 10), "match_reg")
-    match_t = _type_structure(sb_match)
-    bv.define_user_type(_qn(T_MATCH), match_t)
-    match_named = Type.named_type_from_type(_qn(T_MATCH), match_t)
+    match_t = _build_struct(MATCH_SPEC)
+    bv.define_user_type(QN_MATCH, match_t)
+    match_named = Type.named_type_from_type(QN_MATCH, match_t)
 
     # MaskRegisterBlock { u32 mask_reg[12]; }
-    sb_mask = StructureBuilder.create()
-    sb_mask.packed = True
-    sb_mask.append(Type.array(u32(), 12), "mask_reg")
-    mask_t = _type_structure(sb_mask)
-    bv.define_user_type(_qn(T_MASK), mask_t)
-    mask_named = Type.named_type_from_type(_qn(T_MASK), mask_t)
+    mask_t = _build_struct(MASK_SPEC)
+    bv.define_user_type(QN_MASK, mask_t)
+    mask_named = Type.named_type_from_type(QN_MASK, mask_t)
 
     # AMD_Zen_MicroOp (packed 4 bytes)
-    sb_uop = StructureBuilder.create()
-    sb_uop.packed = True
-    sb_uop.append(opcode_field_t, "opcode")
-    sb_uop.append(u8(), "b1")
-    sb_uop.append(u16(), "imm16")
-    uop_t = _type_structure(sb_uop)
-    bv.define_user_type(_qn(T_UOP), uop_t)
-    uop_named = Type.named_type_from_type(_qn(T_UOP), uop_t)
+    uop_t = _build_struct([
+        (opcode_field_t, "opcode"),
+        (_U8,            "b1"),
+        (_U16,           "imm16"),
+    ])
+    bv.define_user_type(QN_UOP, uop_t)
+    uop_named = Type.named_type_from_type(QN_UOP, uop_t)
+
+    # Scalar uop alias: the region defaults to a dense uint32 array (struct
+    # arrays render far slower); per-field display stays opt-in via the
+    # "(struct uops)" command and decode_uop.
+    bv.define_user_type(QN_UOP32, _U32)
+    uop32_named = Type.named_type_from_type(QN_UOP32, _U32)
 
     # AMD_Zen_MicrocodeRegion
-    sb_microcode = StructureBuilder.create()
-    sb_microcode.packed = True
-    sb_microcode.append(Type.array(uop_named, UOP_COUNT), "uops")
-    microcode_t = _type_structure(sb_microcode)
-    bv.define_user_type(_qn(T_MICROCODE), microcode_t)
-    microcode_named = Type.named_type_from_type(_qn(T_MICROCODE), microcode_t)
+    microcode_t = _build_struct([
+        (Type.array(uop32_named, UOP_COUNT), "uops"),
+    ])
+    bv.define_user_type(QN_MICROCODE, microcode_t)
+    microcode_named = Type.named_type_from_type(QN_MICROCODE, microcode_t)
 
     # AMD_MC_Patch
-    sb_patch = StructureBuilder.create()
-    sb_patch.packed = True
-    sb_patch.append(hdr_named, "header")
-    sb_patch.append(Type.array(u8(), SIGNATURE_SIZE), "signature")
-    sb_patch.append(Type.array(u8(), MODULUS_SIZE), "modulus")
-    sb_patch.append(Type.array(u8(), CHECK_SIZE), "check")
-    sb_patch.append(opts_named, "options")
-    sb_patch.append(u32(), "rev")
-    sb_patch.append(match_named, "match_regs")
-    sb_patch.append(mask_named, "mask_regs")
-    sb_patch.append(microcode_named, "microcode")
-    patch_t = _type_structure(sb_patch)
-    bv.define_user_type(_qn(T_PATCH), patch_t)
+    patch_t = _build_struct([
+        (hdr_named,                          "header"),
+        (_U8_BLOCK,                          "signature"),
+        (_U8_BLOCK,                          "modulus"),
+        (_U8_BLOCK,                          "check"),
+        (opts_named,                         "options"),
+        (_U32,                               "rev"),
+        (match_named,                        "match_regs"),
+        (mask_named,                         "mask_regs"),
+        (microcode_named,                    "microcode"),
+    ])
+    bv.define_user_type(QN_PATCH, patch_t)
+
+    cached = {
+        T_HDR: hdr_t,
+        T_OPTS: opts_t,
+        T_MATCH: match_t,
+        T_MASK: mask_t,
+        T_MICROCODE: microcode_t,
+        T_PATCH: patch_t,
+        # Named wrappers, so re-entry and the partial-region path never
+        # rebuild them.
+        "cpuid_named": cpuid_named,
+        "hdr_named": hdr_named,
+        "opts_named": opts_named,
+        "match_named": match_named,
+        "mask_named": mask_named,
+        "uop_named": uop_named,
+        "uop32_named": uop32_named,
+        "microcode_named": microcode_named,
+    }
+    bv._amd_mc_types = cached
+    bv._amd_mc_types_done = True
 
     log_info("AMD microcode structs defined in this database.")
+    return cached
 
 #############################
 # Apply layout
 #############################
-def apply_layout_at(bv, base: int):
-    _ensure_types(bv)
+def _begin_undo(bv):
+    try:
+        return True, bv.begin_undo_actions()
+    except Exception:
+        return False, None
+
+def _finish_batch(bv, undo_ok, undo_id):
+    """Commit the undo scope (both API variants) and run one analysis pass."""
+    if undo_ok:
+        try:
+            bv.commit_undo_actions(undo_id)
+        except TypeError:
+            try:
+                bv.commit_undo_actions()
+            except Exception:
+                pass
+        except Exception:
+            pass
+    try:
+        bv.update_analysis_and_wait()
+    except Exception:
+        try:
+            bv.update_analysis()
+        except Exception:
+            pass
+
+def apply_layout_at(bv, base: int, struct_uops: bool = False):
+    """
+    Apply the layout inside one undo scope so the type/var definitions land
+    as a single undoable action, followed by a single analysis pass instead
+    of per-definition incremental reanalysis. With struct_uops the region is
+    displayed as AMD_Zen_MicroOp structs instead of dense uint32 words.
+    """
+    undo_ok, undo_id = _begin_undo(bv)
+    try:
+        _apply_layout(bv, base, struct_uops)
+    finally:
+        _finish_batch(bv, undo_ok, undo_id)
+
+def _region_uop_type(bv, mc_types, struct_uops: bool):
+    """Element type for the region array: the uop struct or the u32 alias."""
+    key, qn, name = (
+        ("uop_named", QN_UOP, T_UOP) if struct_uops
+        else ("uop32_named", QN_UOP32, T_UOP32)
+    )
+    elem = mc_types.get(key)
+    if elem is None:
+        t = bv.get_type_by_name(name)
+        if t is not None:
+            elem = Type.named_type_from_type(qn, t)
+    if elem is None and not struct_uops:
+        # Database typed by an older plugin version without the u32 alias;
+        # fall back to the struct uop rather than failing.
+        elem = mc_types.get("uop_named")
+    return elem
+
+def _apply_layout(bv, base: int, struct_uops: bool = False, snap=None):
+    mc_types = _ensure_types(bv)
     _check_size(bv, base)
 
-    patch_t     = bv.get_type_by_name(T_PATCH)
-    hdr_t       = bv.get_type_by_name(T_HDR)
-    opts_t      = bv.get_type_by_name(T_OPTS)
-    match_t     = bv.get_type_by_name(T_MATCH)
-    mask_t      = bv.get_type_by_name(T_MASK)
-    microcode_t = bv.get_type_by_name(T_MICROCODE)
+    patch_t     = mc_types.get(T_PATCH)
+    hdr_t       = mc_types.get(T_HDR)
+    opts_t      = mc_types.get(T_OPTS)
+    match_t     = mc_types.get(T_MATCH)
+    mask_t      = mc_types.get(T_MASK)
+    microcode_t = mc_types.get(T_MICROCODE)
 
     if not all([patch_t, hdr_t, opts_t, match_t, mask_t, microcode_t]):
         log_error("Types missing after definition; type creation failed on this build.")
         return
 
-    _define_var(
-        bv, base + 0x0, patch_t,
-        "amd_mc_patch",
-        "AMD microcode patch container (header/signature/modulus/check/options/rev/match/mask/microcode)"
-    )
-
-    _define_var(bv, base + HDR_OFF, hdr_t, "amd_mc_header", "AMD microcode patch header")
-
     # Auto-comment proc_sig with CPU description from CPUID database
     # proc_sig in the microcode header is a processor revision ID, not raw CPUID EAX
     try:
-        raw = bv.read(base + 0x18, 4)
-        if len(raw) == 4:
-            proc_rev = int.from_bytes(raw, "little")
+        if snap is None:
+            snap = _snapshot(bv, base)
+        if len(snap) >= 0x18 + 4:
+            proc_rev = int.from_bytes(bytes(snap[0x18:0x18 + 4]), "little")
             cpuid_val = _proc_rev_to_cpuid(proc_rev)
             desc = _cpuid_description(cpuid_val)
             if desc:
@@ -482,74 +784,157 @@ def apply_layout_at(bv, base: int):
             else:
                 comment = f"ProcRev 0x{proc_rev:04X} -> CPUID {cpuid_val:08X} (not in cpuid_descriptions.json)"
             bv.set_comment_at(base + 0x18, comment)
-            log_info(comment)
+            _log_info_lazy("{}", comment)
     except Exception:
         pass
 
-    _define_var(
-        bv, base + SIGNATURE_OFF, Type.array(u8(), SIGNATURE_SIZE),
-        "amd_mc_signature", "0x100-byte signature block"
-    )
-    _define_var(
-        bv, base + MODULUS_OFF, Type.array(u8(), MODULUS_SIZE),
-        "amd_mc_modulus", "0x100-byte modulus block"
-    )
-    _define_var(
-        bv, base + CHECK_OFF, Type.array(u8(), CHECK_SIZE),
-        "amd_mc_check", "0x100-byte check block"
-    )
-    _define_var(
-        bv, base + OPTIONS_OFF, opts_t,
-        "amd_mc_options", "autorun/encrypted/loaderid option bytes"
-    )
-    _define_var(
-        bv, base + REV_OFF, u32(),
-        "amd_mc_rev", "Revision copy from the extended header area"
-    )
-    _define_var(
-        bv, base + MATCH_OFF, match_t,
-        "amd_mc_match_regs", "Match register block"
-    )
-    _define_var(
-        bv, base + MASK_OFF, mask_t,
-        "amd_mc_mask_regs", "Mask register block"
-    )
-
-    # Microcode region (auto-size if partial)
     file_end = bv.end
-    microcode_base = base + MICROCODE_OFF
-    if microcode_base >= file_end:
-        log_warn("No bytes available for microcode region at this base.")
-        return
-
-    available = file_end - microcode_base
-    microcode_size = min(available, MICROCODE_SIZE)
-    microcode_size -= (microcode_size % UOP_SIZE)
-    uops_count = microcode_size // UOP_SIZE
+    available = max(0, file_end - base)
 
-    if microcode_size == MICROCODE_SIZE:
+    if available >= PATCH_SIZE and not struct_uops:
+        # Full blob: the container struct already types header through
+        # microcode, so one type application covers everything. Sub-regions
+        # only get symbols/comments on top of it.
         _define_var(
-            bv, microcode_base, microcode_t,
-            "amd_ucode_region", "Decoded microcode uop region"
+            bv, base, patch_t,
+            "amd_mc_patch",
+            "AMD microcode patch container (header/signature/modulus/check/options/rev/match/mask/microcode)"
         )
+        for off, sym, comment in PATCH_SUB_SYMBOLS:
+            # Clear any per-field var left by an earlier apply so it does not
+            # overlap the container.
+            _safe_undef_var(bv, base + off)
+            bv.define_user_symbol(Symbol(SymbolType.DataSymbol, base + off, sym))
+            bv.set_comment_at(base + off, comment)
+        uops_count = UOP_COUNT
     else:
-        type_str = f"struct AMD_Zen_MicrocodeRegion_auto {{ {T_UOP} uops[{uops_count}]; }};"
-        auto_t, _ = bv.parse_type_string(type_str)
+        # Partial blob (or opt-in struct-uop display): per-field definitions
+        # so everything that fits is still typed.
+        _define_var(bv, base + HDR_OFF, hdr_t, "amd_mc_header", "AMD microcode patch header")
+        _define_var(
+            bv, base + SIGNATURE_OFF, _U8_BLOCK,
+            "amd_mc_signature", "0x100-byte signature block"
+        )
+        _define_var(
+            bv, base + MODULUS_OFF, _U8_BLOCK,
+            "amd_mc_modulus", "0x100-byte modulus block"
+        )
+        _define_var(
+            bv, base + CHECK_OFF, _U8_BLOCK,
+            "amd_mc_check", "0x100-byte check block"
+        )
         _define_var(
-            bv, microcode_base, auto_t,
-            "amd_ucode_region", "Decoded microcode uop region (auto-sized)"
+            bv, base + OPTIONS_OFF, opts_t,
+            "amd_mc_options", "autorun/encrypted/loaderid option bytes"
+        )
+        _define_var(
+            bv, base + REV_OFF, u32(),
+            "amd_mc_rev", "Revision copy from the extended header area"
+        )
+        _define_var(
+            bv, base + MATCH_OFF, match_t,
+            "amd_mc_match_regs", "Match register block"
+        )
+        _define_var(
+            bv, base + MASK_OFF, mask_t,
+            "amd_mc_mask_regs", "Mask register block"
         )
 
-    try:
-        bv.update_analysis()
-    except Exception:
-        pass
+        # Microcode region (auto-size)
+        microcode_base = base + MICROCODE_OFF
+        if microcode_base >= file_end:
+            log_warn("No bytes available for microcode region at this base.")
+            return
+
+        microcode_size = min(file_end - microcode_base, MICROCODE_SIZE)
+        microcode_size -= (microcode_size % UOP_SIZE)
+        uops_count = microcode_size // UOP_SIZE
+
+        # Build the array directly; no need to round-trip through the
+        # type-string parser just for a different element count.
+        elem = _region_uop_type(bv, mc_types, struct_uops)
+        if elem is None:
+            log_warn("No uop element type available; skipping microcode region.")
+            return
+        suffix = " (auto-sized)" if uops_count != UOP_COUNT else ""
+        _define_var(
+            bv, microcode_base, Type.array(elem, uops_count),
+            "amd_ucode_region", "Decoded microcode uop region" + suffix
+        )
 
-    log_info(
-        f"Applied AMD microcode layout at 0x{base:x} "
-        f"(microcode_off=0x{MICROCODE_OFF:x}, uops={uops_count:#x})."
+    _log_info_lazy(
+        "Applied AMD microcode layout at 0x{:x} "
+        "(microcode_off=0x{:x}, uops={:#x}).",
+        base, MICROCODE_OFF, uops_count
     )
 
+#############################
+# Sweep: apply across consecutive patch slots
+#############################
+def apply_layout_sweep(bv, start: int, count: int):
+    """
+    Apply the layout at up to `count` back-to-back 0x3820-byte patch slots
+    starting at `start`. Candidate headers are validated against plausible
+    date fields over one bulk read, so implausible slots are skipped without
+    touching the database. Valid slots are applied from a thread pool (BN's
+    native calls release the GIL), all inside one undo scope with one
+    analysis pass at the end.
+    """
+    if count <= 0:
+        return
+
+    buf = bv.read(start, count * PATCH_SIZE)
+    usable = len(buf) // PATCH_SIZE
+    if usable < count:
+        log_warn(f"Only {usable} of {count} requested patch slots are fully present; sweeping those.")
+    if usable == 0:
+        log_warn("No full patch slot available at this base.")
+        return
+
+    if np is not None:
+        arr = np.frombuffer(buf, dtype=np.uint8)[: usable * PATCH_SIZE].reshape(usable, PATCH_SIZE)
+        years = arr[:, 0].astype(np.uint16) | (arr[:, 1].astype(np.uint16) << 8)
+        months = arr[:, 3]
+        valid = (years >= 2000) & (years <= 2100) & (months >= 1) & (months <= 12)
+        slots = np.flatnonzero(valid).tolist()
+    else:
+        slots = []
+        for i in range(usable):
+            off = i * PATCH_SIZE
+            year = int.from_bytes(buf[off:off + 2], "little")
+            month = buf[off + 3]
+            if 2000 <= year <= 2100 and 1 <= month <= 12:
+                slots.append(i)
+
+    # Hand each slot its zero-copy slice of the bulk read, so the per-slot
+    # header validator does not read from the view again.
+    if np is not None:
+        jobs = [(start + i * PATCH_SIZE, arr[i]) for i in slots]
+    else:
+        mv = memoryview(buf)
+        jobs = [
+            (start + i * PATCH_SIZE, mv[i * PATCH_SIZE:(i + 1) * PATCH_SIZE])
+            for i in slots
+        ]
+    if jobs:
+        _ensure_types(bv)  # up front, so worker threads never race type creation
+        undo_ok, undo_id = _begin_undo(bv)
+        try:
+            try:
+                with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 2)) as ex:
+                    list(ex.map(lambda job: _apply_layout(bv, job[0], snap=job[1]), jobs))
+            except Exception:
+                # Some BN builds may want type/var mutation single-threaded;
+                # redo the sweep serially (applies are idempotent).
+                for b, s in jobs:
+                    _apply_layout(bv, b, snap=s)
+        finally:
+            _finish_batch(bv, undo_ok, undo_id)
+
+    skipped = usable - len(slots)
+    log_info(f"Sweep applied {len(slots)} patch slot(s) from 0x{start:x}"
+             + (f", skipped {skipped} with implausible header dates." if skipped else "."))
+
 #############################
 # Commands
 #############################
@@ -562,20 +947,89 @@ def cmd_apply_at_zero(bv):
 def cmd_apply_at_cursor(bv, addr):
     apply_layout_at(bv, addr)
 
-PluginCommand.register(
-    "AMD Microcode\\Define types (self-contained)",
-    "Define AMD microcode structs (+ enums best-effort) in this database",
-    cmd_define_types
-)
+def _opcode_histogram(bv, reg_base: int, reg_size: int = MICROCODE_SIZE):
+    """
+    Count the opcode byte of every whole uop in the region at reg_base.
+    Returns 256 bins (ndarray or list), or None if no whole uop is available.
+    """
+    data = bv.read(reg_base, reg_size)
+    n = len(data) - (len(data) % UOP_SIZE)
+    if n == 0:
+        return None
+    buf = np.frombuffer(data, dtype=np.uint8)[:n] if np is not None else data[:n]
+    return _uop_opcode_hist(buf)
+
+def cmd_report_opcodes(bv, addr):
+    """Report the most frequent uop opcodes in the region starting at the cursor."""
+    hist = _opcode_histogram(bv, addr)
+    if hist is None:
+        log_warn("No uop bytes available at this address.")
+        return
+    pairs = sorted(((int(c), op) for op, c in enumerate(hist) if c), reverse=True)
+    total = sum(c for c, _ in pairs)
+    log_info(f"Opcode histogram over {total:#x} uops at 0x{addr:x} (top {min(10, len(pairs))}):")
+    for c, op in pairs[:10]:
+        names = _OPCODE_NAMES.get(op)
+        label = " / ".join(names) if names else "(not in AMD_Zen_Opcode enum)"
+        log_info(f"  0x{op:02X}  x{c}  {label}")
+
+def cmd_apply_struct_uops(bv, addr):
+    apply_layout_at(bv, addr, struct_uops=True)
+
+def cmd_apply_sweep(bv, addr):
+    count = get_int_input(
+        "Number of consecutive 0x3820-byte patch slots to scan",
+        "AMD Microcode Sweep"
+    )
+    if not count:
+        return
+    apply_layout_sweep(bv, addr, int(count))
 
-PluginCommand.register(
-    "AMD Microcode\\Apply layout at file start (0x0)",
-    "Define types (if needed) and apply AMD microcode layout at 0",
-    cmd_apply_at_zero
-)
+_REGISTERED = False
 
-PluginCommand.register_for_address(
-    "AMD Microcode\\Apply layout at cursor",
-    "Define types (if needed) and apply AMD microcode layout at cursor address",
-    cmd_apply_at_cursor
-)
+def _register_commands():
+    # Idempotent so a re-import during development cannot register the
+    # commands twice.
+    global _REGISTERED
+    if _REGISTERED:
+        return
+
+    PluginCommand.register(
+        "AMD Microcode\\Define types (self-contained)",
+        "Define AMD microcode structs (+ enums best-effort) in this database",
+        cmd_define_types
+    )
+
+    PluginCommand.register(
+        "AMD Microcode\\Apply layout at file start (0x0)",
+        "Define types (if needed) and apply AMD microcode layout at 0",
+        cmd_apply_at_zero
+    )
+
+    PluginCommand.register_for_address(
+        "AMD Microcode\\Apply layout at cursor",
+        "Define types (if needed) and apply AMD microcode layout at cursor address",
+        cmd_apply_at_cursor
+    )
+
+    PluginCommand.register_for_address(
+        "AMD Microcode\\Apply layout at cursor (struct uops)",
+        "Apply the layout with per-field AMD_Zen_MicroOp display instead of the dense uint32 region",
+        cmd_apply_struct_uops
+    )
+
+    PluginCommand.register_for_address(
+        "AMD Microcode\\Apply layout sweep from cursor",
+        "Scan consecutive patch slots from the cursor and apply the layout at plausible headers",
+        cmd_apply_sweep
+    )
+
+    PluginCommand.register_for_address(
+        "AMD Microcode\\Report opcode histogram",
+        "Count uop opcode bytes in the microcode region starting at the cursor",
+        cmd_report_opcodes
+    )
+
+    _REGISTERED = True
+
+_register_commands()